@@ -0,0 +1,39 @@
+import os
+import sys
+
+from pymongo import AsyncMongoClient, MongoClient
+
+# Configuration
+# Priority: Command Line Arg > Environment Variable > Localhost
+if len(sys.argv) > 1:
+    MONGO_URI = sys.argv[1]
+else:
+    MONGO_URI = os.getenv("DATABASE_URL", "mongodb://localhost:27017/")
+
+DB_NAME = "employee-management"
+
+# Shared pool settings. populate_data.py sends bulk_write batches concurrently via
+# asyncio.gather and each in-flight batch holds a connection, so maxPoolSize caps
+# that fan-out at 20 batches (20 x INSERT_BATCH_SIZE docs) in flight
+CLIENT_OPTIONS = {
+    "maxPoolSize": 20,
+    "minPoolSize": 2,
+    "maxIdleTimeMS": 60000,
+    "compressors": "zstd"
+}
+
+# One lazily created client per process; overrides only apply on the first call
+_client = None
+_async_client = None
+
+def get_client(**overrides):
+    global _client
+    if _client is None:
+        _client = MongoClient(MONGO_URI, **{**CLIENT_OPTIONS, **overrides})
+    return _client
+
+def get_async_client(**overrides):
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(MONGO_URI, **{**CLIENT_OPTIONS, **overrides})
+    return _async_client
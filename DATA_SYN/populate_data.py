@@ -1,60 +1,117 @@
+import asyncio
 import pymongo
+from pymongo import IndexModel, InsertOne
 from faker import Faker
+import numpy as np
 import random
-from datetime import datetime, timedelta
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote_plus
 
 import sys
 import os
 
-# Configuration
-# Priority: Command Line Arg > Environment Variable > Localhost
-if len(sys.argv) > 1:
-    MONGO_URI = sys.argv[1]
-else:
-    MONGO_URI = os.getenv("DATABASE_URL", "mongodb://localhost:27017/")
+from _mongo import DB_NAME, MONGO_URI, get_async_client
 
-print(f"Connecting to MongoDB at: {MONGO_URI}")
+AVATAR_PREFIX = "https://api.dicebear.com/7.x/avataaars/svg?seed="
 
-DB_NAME = "employee-management"
-fake = Faker()
+# Fixed seed keeps generated data reproducible between runs; override with SEED
+SEED = int(os.getenv("SEED", "42"))
+fake = Faker("en_US")
+Faker.seed(SEED)
+random.seed(SEED)
+rng = np.random.default_rng(SEED)
 
-# Connect to MongoDB
+def trim_text(value, limit):
+    # Cut at the last sentence (or else word) boundary under limit, like Faker's max_nb_chars
+    if len(value) <= limit:
+        return value
+    cut = value[:limit]
+    end = cut.rfind(".")
+    if end > 0:
+        return cut[:end + 1]
+    return cut.rsplit(" ", 1)[0]
+
+# Text providers: mimesis is considerably faster than Faker, which stays as the fallback
 try:
-    client = pymongo.MongoClient(MONGO_URI)
-    # Ping to verify connection
-    client.admin.command('ping')
-    print("Successfully connected to MongoDB!")
-except Exception as e:
-    print(f"Failed to connect to MongoDB: {e}")
-    sys.exit(1)
-
-db = client[DB_NAME]
-
-# Collections
-col_counter = db["Counter"]
-col_dept_parent = db["DepartmentParent"]
-col_dept_child = db["DepartmentChild"]
-col_employee = db["Employee"]
-col_project = db["Project"]
-col_project_employee = db["ProjectEmployee"]
+    from mimesis import Finance, Person, Text
+    person, text, finance = Person(seed=SEED), Text(seed=SEED), Finance(seed=SEED)
+    mimesis_providers = (person, text, finance)
+    gen_first_name = person.first_name
+    gen_last_name = person.last_name
+    gen_phone = person.telephone
+
+    def gen_about():
+        return trim_text(text.text(quantity=3), 200)
+
+    def gen_project_name():
+        # text.title() returns whole sentences; keep project names title-length like bs().title()
+        return " ".join(text.words(quantity=3)).title()
+
+    gen_company = finance.company
+    gen_paragraph = text.text
+    gen_sentence = text.sentence
+except ImportError:
+    mimesis_providers = ()
+    gen_first_name = fake.first_name
+    gen_last_name = fake.last_name
+    gen_phone = fake.phone_number
+
+    def gen_about():
+        return fake.text(max_nb_chars=200)
+
+    def gen_project_name():
+        return fake.bs().title()
+
+    gen_company = fake.company
+    gen_paragraph = fake.paragraph
+    gen_sentence = fake.sentence
+
+# Long-form text is the slowest provider call; sample it from a fixed corpus instead
+TEXT_POOL_SIZE = 128
+TEXT_POOL = [gen_about() for _ in range(TEXT_POOL_SIZE)]
+PARAGRAPH_POOL = [gen_paragraph() for _ in range(TEXT_POOL_SIZE)]
+SENTENCE_POOL = [gen_sentence() for _ in range(TEXT_POOL_SIZE)]
 
 # Counter Management
-def get_next_sequence(key, start_at):
-    # Ensure counter exists
-    counter = col_counter.find_one({"key": key})
-    if not counter:
-        col_counter.insert_one({"key": key, "value": start_at - 1, "createdAt": datetime.now(), "updatedAt": datetime.now()})
-    
-    # Increment and return
-    result = col_counter.find_one_and_update(
+async def reserve_sequence(db, key, n, start_at):
+    # Reserve n consecutive IDs in one round-trip. A pipeline update lets the
+    # upsert seed the counter at start_at - 1 and add n in the same operation
+    # ($setOnInsert and $inc cannot both target "value").
+    now = datetime.now(timezone.utc)
+    result = await db["Counter"].find_one_and_update(
         {"key": key},
-        {"$inc": {"value": 1}},
+        [{"$set": {
+            "value": {"$add": [{"$ifNull": ["$value", start_at - 1]}, n]},
+            "createdAt": {"$ifNull": ["$createdAt", now]},
+            "updatedAt": now
+        }}],
+        upsert=True,
         return_document=pymongo.ReturnDocument.AFTER
     )
-    return result["value"]
+    high = result["value"]
+    return range(high - n + 1, high + 1)
 
-def populate_departments():
+# Bulk Writes
+INSERT_BATCH_SIZE = 1000
+
+async def bulk_insert(col, docs):
+    # bulk_write keeps a single batched round-trip like insert_many, but leaves
+    # room to mix in UpdateOne upserts if seeding ever needs to be idempotent.
+    # Large inputs are split into batches that are sent concurrently.
+    batches = [docs[i:i + INSERT_BATCH_SIZE] for i in range(0, len(docs), INSERT_BATCH_SIZE)]
+    await asyncio.gather(*[
+        col.bulk_write([InsertOne(doc) for doc in batch], ordered=False)
+        for batch in batches
+    ])
+
+async def populate_departments(db):
     print("Populating Departments...")
+    col_dept_parent = db["DepartmentParent"]
+    col_dept_child = db["DepartmentChild"]
+    now = datetime.now(timezone.utc)
     departments = [
         {"name": "Engineering", "children": ["Frontend", "Backend", "DevOps", "QA"]},
         {"name": "Product", "children": ["Product Management", "Design"]},
@@ -63,8 +120,6 @@ def populate_departments():
         {"name": "Marketing", "children": ["Digital Marketing", "Content"]}
     ]
 
-    dept_map = [] # To store (child_id, name) for employee assignment
-
     # Use simple integer IDs for departments if not strictly controlled by a counter in this specific app logic,
     # but looking at schema, they are Ints. I'll use a local counter or simple increment.
     # The app seems to rely on `departmentId` and `childDeptId` being Ints.
@@ -75,151 +130,331 @@ def populate_departments():
     parent_id = 1
     child_id = 1
     
-    existing_parent = col_dept_parent.find_one(sort=[("departmentId", -1)])
+    existing_parent = await col_dept_parent.find_one(sort=[("departmentId", -1)])
     if existing_parent:
         parent_id = existing_parent["departmentId"] + 1
 
-    existing_child = col_dept_child.find_one(sort=[("childDeptId", -1)])
+    existing_child = await col_dept_child.find_one(sort=[("childDeptId", -1)])
     if existing_child:
         child_id = existing_child["childDeptId"] + 1
 
-    for d in departments:
-        # Create Parent
-        p_doc = {
-            "departmentId": parent_id,
+    template = {"createdAt": now, "updatedAt": now}
+    child_ids = itertools.count(child_id)
+
+    # IDs are local counters, so both levels can be built up front
+    parent_docs = [
+        {
+            **template,
+            "departmentId": parent_id + i,
             "departmentName": d["name"],
-            "description": f"{d['name']} Department",
-            "createdAt": datetime.now(),
-            "updatedAt": datetime.now()
+            "description": f"{d['name']} Department"
         }
-        col_dept_parent.insert_one(p_doc)
-        current_p_id = parent_id
-        parent_id += 1
-
-        # Create Children
-        for child_name in d["children"]:
-            c_doc = {
-                "childDeptId": child_id,
-                "departmentName": child_name,
-                "parentDeptId": current_p_id,
-                "description": f"{child_name} Team",
-                "createdAt": datetime.now(),
-                "updatedAt": datetime.now()
-            }
-            col_dept_child.insert_one(c_doc)
-            dept_map.append(child_id)
-            child_id += 1
-            
-    return dept_map
+        for i, d in enumerate(departments)
+    ]
+    child_docs = [
+        {
+            **template,
+            "childDeptId": next(child_ids),
+            "departmentName": child_name,
+            "parentDeptId": parent_id + i,
+            "description": f"{child_name} Team"
+        }
+        for i, d in enumerate(departments)
+        for child_name in d["children"]
+    ]
+
+    # MongoDB has no foreign keys, so child docs don't need their parent stored first
+    await bulk_insert(col_dept_parent, parent_docs)
+    await bulk_insert(col_dept_child, child_docs)
+
+    # Child IDs are used for employee department assignment
+    return [c["childDeptId"] for c in child_docs]
+
+# Parallel document generation
+# Faker/mimesis are pure Python, so shard large batches across processes.
+# Chunks have a fixed size and seed so output doesn't depend on the CPU count.
+PARALLEL_MIN_DOCS = 1000
+GENERATION_CHUNK_SIZE = 500
+
+def seed_generators(seed):
+    # Give each chunk its own random streams so workers don't produce identical data
+    global rng
+    rng = np.random.default_rng(seed)
+    random.seed(seed)
+    fake.seed_instance(seed)
+    for provider in mimesis_providers:
+        provider.reseed(seed)
+
+async def generate_and_insert(col, builder, ids, *args):
+    ids = list(ids)
+    id_chunks = [ids[i:i + GENERATION_CHUNK_SIZE] for i in range(0, len(ids), GENERATION_CHUNK_SIZE)]
+    # One seed per chunk plus one to reseed the parent afterwards, so both paths
+    # leave the parent generators in the same state
+    seeds = rng.integers(2**32, size=len(id_chunks) + 1).tolist()
+    resume_seed = seeds.pop()
+
+    try:
+        if len(ids) < PARALLEL_MIN_DOCS or (os.cpu_count() or 1) == 1:
+            for chunk, seed in zip(id_chunks, seeds):
+                await bulk_insert(col, builder(chunk, *args, seed))
+        else:
+            await _generate_in_pool(col, builder, id_chunks, seeds, args)
+    finally:
+        seed_generators(resume_seed)
+
+async def _generate_in_pool(col, builder, id_chunks, seeds, args):
+    loop = asyncio.get_running_loop()
+    # spawn avoids forking a process that already holds a MongoClient
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as ex:
+        pending = [
+            loop.run_in_executor(ex, builder, chunk, *args, seed)
+            for chunk, seed in zip(id_chunks, seeds)
+        ]
+        # Insert each chunk as soon as it is built so writes overlap the remaining generation
+        inserts = []
+        try:
+            for fut in asyncio.as_completed(pending):
+                inserts.append(asyncio.create_task(bulk_insert(col, await fut)))
+        except BaseException:
+            # A worker failed: stop the inserts already started and reap them before re-raising
+            for task in inserts:
+                task.cancel()
+            await asyncio.gather(*inserts, return_exceptions=True)
+            raise
+        await asyncio.gather(*inserts)
+
+def build_employee_chunk(emp_ids, dept_ids, now, seed):
+    seed_generators(seed)
+    count = len(emp_ids)
+    docs = []
 
-def populate_employees(count, dept_ids):
-    print(f"Populating {count} Employees...")
-    employees = []
-    
     roles = ["Developer", "Senior Developer", "Manager", "Designer", "Product Manager", "Sales Rep"]
     locations = ["New York", "London", "Remote", "Bangalore", "San Francisco"]
+    skills = ["Python", "Angular", "React", "Node.js", "MongoDB", "SQL", "AWS", "Design"]
 
-    for _ in range(count):
-        emp_id = get_next_sequence("employee", 1000)
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        name = f"{first_name} {last_name}"
-        
+    # Draw every random column up front; tolist() converts to native types for BSON
+    dept_arr = rng.choice(dept_ids, size=count).tolist() if dept_ids else [None] * count
+    role_arr = rng.choice(roles, size=count).tolist()
+    loc_arr = rng.choice(locations, size=count).tolist()
+    # 3 distinct skills per row: argpartition of random keys picks a row-wise sample without replacement
+    skills_idx = rng.random((count, len(skills))).argpartition(3, axis=1)[:, :3].tolist()
+    about_idx = rng.integers(0, TEXT_POOL_SIZE, size=count).tolist()
+
+    # Fields shared by every document; copied per doc with {**template}
+    template = {
+        "password": "password123", # Plain text as per sample, usually hashed but for synthetic...
+        "isActive": True,
+        "createdAt": now,
+        "updatedAt": now
+    }
+
+    # Name-derived columns as parallel lists, zipped into docs below
+    first_names = [gen_first_name() for _ in range(count)]
+    last_names = [gen_last_name() for _ in range(count)]
+    names = [f"{f} {l}" for f, l in zip(first_names, last_names)]
+    emails = [f"{f.lower()}.{l.lower()}@example.com" for f, l in zip(first_names, last_names)]
+    avatars = [AVATAR_PREFIX + quote_plus(n) for n in names]
+
+    for i, emp_id in enumerate(emp_ids):
         doc = {
+            **template,
             "employeeId": emp_id,
-            "employeeName": name,
-            "emailId": f"{first_name.lower()}.{last_name.lower()}@example.com",
-            "deptId": random.choice(dept_ids) if dept_ids else None,
-            "role": random.choice(roles),
-            "contactNo": fake.phone_number(),
-            "password": "password123", # Plain text as per sample, usually hashed but for synthetic...
-            "isActive": True,
-            "avatarUrl": f"https://api.dicebear.com/7.x/avataaars/svg?seed={name}",
-            "location": random.choice(locations),
-            "about": fake.text(max_nb_chars=200),
-            "skills": random.sample(["Python", "Angular", "React", "Node.js", "MongoDB", "SQL", "AWS", "Design"], k=3),
-            "createdAt": datetime.now(),
-            "updatedAt": datetime.now()
+            "employeeName": names[i],
+            "emailId": emails[i],
+            "deptId": dept_arr[i],
+            "role": role_arr[i],
+            "contactNo": gen_phone(),
+            "avatarUrl": avatars[i],
+            "location": loc_arr[i],
+            "about": TEXT_POOL[about_idx[i]],
+            "skills": [skills[j] for j in skills_idx[i]]
         }
-        col_employee.insert_one(doc)
-        employees.append(emp_id)
+        docs.append(doc)
+
+    return docs
+
+async def populate_employees(db, count, dept_ids):
+    print(f"Populating {count} Employees...")
+    now = datetime.now(timezone.utc)
+
+    emp_ids = await reserve_sequence(db, "employee", count, 1000)
+    await generate_and_insert(db["Employee"], build_employee_chunk, emp_ids, dept_ids, now)
         
-    return employees
+    return list(emp_ids)
 
-def populate_projects(count, employee_ids):
-    print(f"Populating {count} Projects...")
-    projects = []
+def build_project_chunk(proj_ids, employee_ids, now, seed):
+    seed_generators(seed)
+    count = len(proj_ids)
+    docs = []
     statuses = ["active", "draft", "completed", "on_hold"]
-    
-    for _ in range(count):
-        proj_id = get_next_sequence("project", 5000)
-        proj_name = fake.bs().title()
+
+    start_offsets = rng.integers(0, 366, size=count).tolist()
+    durations = rng.integers(30, 366, size=count).tolist()
+    lead_arr = rng.choice(employee_ids, size=count).tolist() if employee_ids else [None] * count
+    status_arr = rng.choice(statuses, size=count).tolist()
+    readiness_arr = rng.integers(50, 101, size=count).tolist()
+    progress_arr = rng.integers(0, 101, size=count).tolist()
+    summary_idx = rng.integers(0, TEXT_POOL_SIZE, size=count).tolist()
+    objective_idx = rng.integers(0, TEXT_POOL_SIZE, size=(count, 3)).tolist()
+
+    template = {"createdAt": now, "updatedAt": now}
+
+    for i, proj_id in enumerate(proj_ids):
+        proj_name = gen_project_name()
         
-        start_date = datetime.now() - timedelta(days=random.randint(0, 365))
-        end_date = start_date + timedelta(days=random.randint(30, 365))
+        start_date = now - timedelta(days=start_offsets[i])
+        end_date = start_date + timedelta(days=durations[i])
         
         doc = {
+            **template,
             "projectId": proj_id,
             "projectName": proj_name,
-            "clientName": fake.company(),
+            "clientName": gen_company(),
             "startDate": start_date,
             "endDate": end_date,
-            "leadByEmpId": random.choice(employee_ids) if employee_ids else None,
-            "status": random.choice(statuses),
-            "readinessScore": random.randint(50, 100),
-            "progress": random.randint(0, 100),
+            "leadByEmpId": lead_arr[i],
+            "status": status_arr[i],
+            "readinessScore": readiness_arr[i],
+            "progress": progress_arr[i],
             "overview": {
-                "summary": fake.paragraph(),
-                "objectives": [fake.sentence() for _ in range(3)]
-            },
-            "createdAt": datetime.now(),
-            "updatedAt": datetime.now()
+                "summary": PARAGRAPH_POOL[summary_idx[i]],
+                "objectives": [SENTENCE_POOL[j] for j in objective_idx[i]]
+            }
         }
-        col_project.insert_one(doc)
-        projects.append(proj_id)
+        docs.append(doc)
+
+    return docs
+
+async def populate_projects(db, count, employee_ids):
+    print(f"Populating {count} Projects...")
+    now = datetime.now(timezone.utc)
+    
+    proj_ids = await reserve_sequence(db, "project", count, 5000)
+    await generate_and_insert(db["Project"], build_project_chunk, proj_ids, employee_ids, now)
         
-    return projects
+    return list(proj_ids)
 
-def populate_assignments(projects, employees):
+async def populate_assignments(db, projects, employees):
     print("Populating Project Assignments...")
+    now = datetime.now(timezone.utc)
+    docs = []
+
+    # Assign 3-8 employees per project
+    team_sizes = rng.integers(3, min(8, len(employees)) + 1, size=len(projects))
+    teams = [
+        (proj_id, rng.choice(employees, size=team_size, replace=False).tolist())
+        for proj_id, team_size in zip(projects, team_sizes.tolist())
+    ]
+
+    total = int(team_sizes.sum())
+    assign_ids = iter(await reserve_sequence(db, "projectEmployee", total, 7000))
+
+    roles = ["Contributor", "Reviewer", "Lead"]
+    allocations = [25, 50, 100]
+    role_arr = iter([roles[c] for c in rng.integers(0, len(roles), size=total).tolist()])
+    alloc_arr = iter([allocations[c] for c in rng.integers(0, len(allocations), size=total).tolist()])
+    days_arr = iter(rng.integers(0, 101, size=total).tolist())
+
+    template = {"isActive": True, "createdAt": now, "updatedAt": now}
     
-    for proj_id in projects:
-        # Assign 3-8 employees per project
-        team_size = random.randint(3, min(8, len(employees)))
-        team = random.sample(employees, team_size)
-        
+    for proj_id, team in teams:
         for emp_id in team:
-            assign_id = get_next_sequence("projectEmployee", 7000)
+            assign_id = next(assign_ids)
             
             doc = {
+                **template,
                 "empProjectId": assign_id,
                 "projectId": proj_id,
                 "empId": emp_id,
-                "role": random.choice(["Contributor", "Reviewer", "Lead"]),
-                "isActive": True,
-                "allocationPct": random.choice([25, 50, 100]),
-                "assignedDate": datetime.now() - timedelta(days=random.randint(0, 100)),
-                "createdAt": datetime.now(),
-                "updatedAt": datetime.now()
+                "role": next(role_arr),
+                "allocationPct": next(alloc_arr),
+                "assignedDate": now - timedelta(days=next(days_arr))
             }
-            col_project_employee.insert_one(doc)
+            docs.append(doc)
 
-def main():
+    await bulk_insert(db["ProjectEmployee"], docs)
+
+# Index Management
+# Maintaining secondary indexes on every insert is slower than one rebuild after the load
+async def drop_secondary_indexes(db, names, snapshot):
+    # Fills snapshot as it goes so a partial drop can still be restored
+    for name in names:
+        col = db[name]
+        specs = await (await col.list_indexes()).to_list()
+        # Unique indexes (e.g. Prisma @unique IDs) stay in place so duplicates are rejected during the load
+        deferred = [spec for spec in specs if spec["name"] != "_id_" and not spec.get("unique")]
+        snapshot[col.name] = []
+        for spec in deferred:
+            await col.drop_index(spec["name"])
+            snapshot[col.name].append(spec)
+
+async def restore_indexes(db, snapshot):
+    # Restore each collection independently; never raises so it can't mask a load error
+    for name, specs in snapshot.items():
+        if not specs:
+            continue
+        models = [
+            IndexModel(list(spec["key"].items()), **{k: v for k, v in spec.items() if k not in ("v", "key", "ns")})
+            for spec in specs
+        ]
+        try:
+            await db[name].create_indexes(models)
+            print(f"Rebuilt {len(models)} index(es) on {name}")
+        except Exception as e:
+            print(f"Failed to rebuild indexes on {name}: {e}")
+
+async def load(db):
     print("Starting Synthetic Data Generation...")
-    
-    # 1. Departments
-    dept_ids = populate_departments()
-    
-    # 2. Employees (Generate 25 to be safe)
-    emp_ids = populate_employees(25, dept_ids)
-    
-    # 3. Projects (Generate 8)
-    proj_ids = populate_projects(8, emp_ids)
-    
-    # 4. Assignments
-    populate_assignments(proj_ids, emp_ids)
+
+    # Department/Counter collections are tiny, so only the bulk ones are unindexed during the load
+    index_snapshot = {}
+
+    try:
+        await drop_secondary_indexes(db, ["Employee", "Project", "ProjectEmployee"], index_snapshot)
+
+        # 1. Departments
+        dept_ids = await populate_departments(db)
+        
+        # 2. Employees (Generate 25 to be safe)
+        emp_ids = await populate_employees(db, 25, dept_ids)
+        
+        # 3. Projects (Generate 8)
+        proj_ids = await populate_projects(db, 8, emp_ids)
+        
+        # 4. Assignments
+        await populate_assignments(db, proj_ids, emp_ids)
+    finally:
+        await restore_indexes(db, index_snapshot)
     
     print("Data Generation Completed Successfully!")
 
+async def main():
+    # Connection setup lives here rather than at import time, since spawned
+    # worker processes re-import this module only to build documents
+    print(f"Connecting to MongoDB at: {MONGO_URI}")
+
+    # Connect to MongoDB (the async client connects lazily, so ping it)
+    try:
+        # Synthetic data is disposable: skip journaling and retries to cut per-write latency.
+        # All collections inherit w=1, journal=False so insert errors (e.g. duplicate-key
+        # rejections) are reported instead of dropped.
+        client = get_async_client(w=1, journal=False, retryWrites=False)
+    except Exception as e:
+        print(f"Failed to connect to MongoDB: {e}")
+        sys.exit(1)
+
+    try:
+        try:
+            # Ping to verify connection
+            await client.admin.command('ping')
+            print("Successfully connected to MongoDB!")
+        except Exception as e:
+            print(f"Failed to connect to MongoDB: {e}")
+            sys.exit(1)
+
+        await load(client[DB_NAME])
+    finally:
+        await client.close()
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
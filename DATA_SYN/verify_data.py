@@ -1,17 +1,13 @@
-import pymongo
+from _mongo import DB_NAME, get_client
 
-# Configuration
-MONGO_URI = "mongodb://localhost:27017/"
-DB_NAME = "employee-management"
-
-# Connect to MongoDB
-client = pymongo.MongoClient(MONGO_URI)
-db = client[DB_NAME]
+# Connect to MongoDB (same URI resolution as populate_data.py)
+db = get_client()[DB_NAME]
 
+# estimated_document_count reads collection metadata instead of scanning
 print("--- Database Verification ---")
-print(f"Employees: {db.Employee.count_documents({})}")
-print(f"Projects: {db.Project.count_documents({})}")
-print(f"Project Assignments: {db.ProjectEmployee.count_documents({})}")
-print(f"Parent Departments: {db.DepartmentParent.count_documents({})}")
-print(f"Child Departments: {db.DepartmentChild.count_documents({})}")
+print(f"Employees: {db.Employee.estimated_document_count()}")
+print(f"Projects: {db.Project.estimated_document_count()}")
+print(f"Project Assignments: {db.ProjectEmployee.estimated_document_count()}")
+print(f"Parent Departments: {db.DepartmentParent.estimated_document_count()}")
+print(f"Child Departments: {db.DepartmentChild.estimated_document_count()}")
 print("---------------------------")